@@ -357,10 +357,42 @@ function createMapApp() {
     updateStory();
   }
 
+  function decodeCategories(geojson) {
+    const dictionaries = geojson.dictionaries;
+    if (!dictionaries) return geojson;
+    (geojson.features || []).forEach((feature) => {
+      const props = feature.properties || {};
+      Object.keys(dictionaries).forEach((field) => {
+        if (typeof props[field] === "number") {
+          props[field] = dictionaries[field][props[field]];
+        }
+      });
+    });
+    return geojson;
+  }
+
+  function decodeCoordinates(geojson) {
+    const transform = geojson.transform;
+    if (!transform) return geojson;
+    const [scaleX, scaleY] = transform.scale;
+    const [translateX, translateY] = transform.translate;
+    (geojson.features || []).forEach((feature) => {
+      const [i, j] = feature.geometry.coordinates;
+      feature.geometry.coordinates = [
+        translateX + i * scaleX,
+        translateY + j * scaleY,
+      ];
+    });
+    return geojson;
+  }
+
   function loadGeoJSON(url) {
     return fetch(url).then((response) => {
       if (!response.ok) throw new Error(`${url} -> ${response.status}`);
-      return response.json();
+      return response
+        .json()
+        .then(decodeCategories)
+        .then(decodeCoordinates);
     });
   }
 
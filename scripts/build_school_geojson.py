@@ -9,9 +9,28 @@ except ModuleNotFoundError:
     from constants import ZIM_BOUNDS
 
 try:
-    from scripts.geo_utils import coords_in_zimbabwe, open_csv, parse_float
+    from scripts.categories import CATEGORICAL_FIELDS, new_dictionaries
 except ModuleNotFoundError:
-    from geo_utils import coords_in_zimbabwe, open_csv, parse_float
+    from categories import CATEGORICAL_FIELDS, new_dictionaries
+
+try:
+    from scripts.geo_utils import (
+        QUANTIZE_MODES,
+        coords_in_zimbabwe,
+        make_quantizer,
+        open_csv,
+        parse_float,
+        write_geojsonseq_files,
+    )
+except ModuleNotFoundError:
+    from geo_utils import (
+        QUANTIZE_MODES,
+        coords_in_zimbabwe,
+        make_quantizer,
+        open_csv,
+        parse_float,
+        write_geojsonseq_files,
+    )
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
@@ -22,13 +41,19 @@ BOUNDS_JSON = DATA_DIR / "bounds.json"
 LEVELS = {
     "Primary": {
         "geojson": DATA_DIR / "primary_schools.geojson",
+        "geojsonseq": DATA_DIR / "primary_schools.geojsons",
+        "ndjson": DATA_DIR / "primary_schools.ndjson",
     },
     "Secondary": {
         "geojson": DATA_DIR / "secondary_schools.geojson",
+        "geojsonseq": DATA_DIR / "secondary_schools.geojsons",
+        "ndjson": DATA_DIR / "secondary_schools.ndjson",
     },
 }
 
-def row_to_feature(row):
+SEQ_FORMATS = ("geojsonseq", "ndjson")
+
+def row_to_feature(row, dictionaries=None, encode=False, quantize=None):
     lat = parse_float(row.get("latitude"))
     lon = parse_float(row.get("longitude"))
     if lat is None or lon is None:
@@ -40,20 +65,27 @@ def row_to_feature(row):
     props = {
         "Schoolnumber": (row.get("Schoolnumber") or "").strip(),
         "Name": (row.get("Name") or "").strip(),
-        "Province": (row.get("Province") or "").strip(),
-        "District": (row.get("District") or "").strip(),
-        "SchoolLevel": (row.get("SchoolLevel") or "").strip(),
-        "Grant_Class": (row.get("Grant_Class") or "").strip(),
     }
+    for field in CATEGORICAL_FIELDS:
+        dictionary = dictionaries.get(field) if dictionaries else None
+        if dictionary is None:
+            props[field] = (row.get(field) or "").strip()
+            continue
+        code = dictionary.encode(row.get(field))
+        props[field] = code if encode else dictionary.decode(code)
+    coordinates = quantize(lon, lat) if quantize else [lon, lat]
     return {
         "type": "Feature",
-        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "geometry": {"type": "Point", "coordinates": coordinates},
         "properties": props,
     }
 
 
-def build_geojson(level, source_path: Path):
-    features = []
+def iter_features(
+    level, source_path: Path, dictionaries=None, encode=False, quantize=None
+):
+    if dictionaries is None:
+        dictionaries = new_dictionaries()
     with open_csv(source_path) as handle:
         reader = csv.DictReader(handle)
         required_fields = {
@@ -74,17 +106,77 @@ def build_geojson(level, source_path: Path):
         for row in reader:
             if (row.get("SchoolLevel") or "").strip() != level:
                 continue
-            feature = row_to_feature(row)
+            feature = row_to_feature(row, dictionaries, encode, quantize)
             if feature:
-                features.append(feature)
-    return {"type": "FeatureCollection", "features": features}
-
-
-def write_outputs(level, config, source_path: Path):
-    geojson = build_geojson(level, source_path)
+                yield feature
+
+
+def build_geojson(
+    level,
+    source_path: Path,
+    encode_categories=False,
+    max_error_m=None,
+    quantize_mode="fixed",
+    dictionaries=None,
+):
+    if dictionaries is None:
+        dictionaries = new_dictionaries()
+    quantize = transform = None
+    if max_error_m is not None:
+        quantize, transform = make_quantizer(max_error_m, quantize_mode)
+    features = list(
+        iter_features(
+            level,
+            source_path,
+            dictionaries,
+            encode=encode_categories,
+            quantize=quantize,
+        )
+    )
+    geojson = {"type": "FeatureCollection", "features": features}
+    if transform:
+        geojson["transform"] = transform
+    if encode_categories:
+        geojson["dictionaries"] = {
+            field: dictionary.values for field, dictionary in dictionaries.items()
+        }
+    return geojson
+
+
+def write_outputs(
+    level,
+    config,
+    source_path: Path,
+    seq_formats=(),
+    encode_categories=False,
+    max_error_m=None,
+    quantize_mode="fixed",
+):
+    dictionaries = new_dictionaries()
+    geojson = build_geojson(
+        level,
+        source_path,
+        encode_categories,
+        max_error_m,
+        quantize_mode,
+        dictionaries=dictionaries,
+    )
     config["geojson"].write_text(
         json.dumps(geojson, ensure_ascii=True), encoding="utf-8"
     )
+    # Sequence files have no header to carry a transform, so they always use
+    # fixed-precision coordinates.
+    seq_quantize = None
+    if max_error_m is not None:
+        seq_quantize, _ = make_quantizer(max_error_m, "fixed")
+    targets = [
+        (config[seq_format], seq_format == "geojsonseq") for seq_format in seq_formats
+    ]
+    if targets:
+        write_geojsonseq_files(
+            iter_features(level, source_path, dictionaries, quantize=seq_quantize),
+            targets,
+        )
 
 
 def write_bounds():
@@ -102,7 +194,36 @@ def main():
         type=Path,
         help="Path to source CSV (defaults to data/clean_schools.csv if present).",
     )
+    parser.add_argument(
+        "--seq",
+        action="append",
+        choices=SEQ_FORMATS,
+        default=[],
+        help="Also write a streaming GeoJSONSeq (RFC 8142) or NDJSON file per level.",
+    )
+    parser.add_argument(
+        "--dictionary-encode",
+        action="store_true",
+        help="Store Province/District/SchoolLevel/Grant_Class as codes into a "
+        "shared 'dictionaries' table in the GeoJSON outputs.",
+    )
+    parser.add_argument(
+        "--max-error-m",
+        type=float,
+        help="Quantize coordinates so no school moves more than this many metres.",
+    )
+    parser.add_argument(
+        "--quantize-mode",
+        choices=QUANTIZE_MODES,
+        help="Requires --max-error-m. 'fixed' rounds decimal degrees and is used "
+        "when --max-error-m is given without a mode; 'integer' writes grid "
+        "indices over ZIM_BOUNDS plus a 'transform' (GeoJSON outputs only).",
+    )
     args = parser.parse_args()
+    if args.max_error_m is not None and args.max_error_m <= 0:
+        parser.error("--max-error-m must be positive")
+    if args.quantize_mode and args.max_error_m is None:
+        parser.error("--quantize-mode requires --max-error-m")
 
     source_path = args.input
     if source_path is None:
@@ -113,7 +234,15 @@ def main():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     write_bounds()
     for level, config in LEVELS.items():
-        write_outputs(level, config, source_path)
+        write_outputs(
+            level,
+            config,
+            source_path,
+            seq_formats=dict.fromkeys(args.seq),
+            encode_categories=args.dictionary_encode,
+            max_error_m=args.max_error_m,
+            quantize_mode=args.quantize_mode or "fixed",
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+from functools import lru_cache
+
+CATEGORICAL_FIELDS = ("Province", "District", "SchoolLevel", "Grant_Class")
+
+# Distinct raw spellings per column are in the dozens; the LRU bound only
+# guards against pathological inputs.
+CATEGORY_CACHE_SIZE = 1024
+
+
+class CategoryDictionary:
+    """Maps the distinct values of one column to small integer codes.
+
+    Raw values go through an LRU-cached normalizer, so each distinct spelling
+    is normalized once, and every row that shares a normalized value shares
+    a single code and a single string object. values holds one entry per
+    distinct normalized value; that table is the dictionary itself.
+    """
+
+    def __init__(self, normalize=str.strip, maxsize=CATEGORY_CACHE_SIZE):
+        self.values = []
+        self._codes = {}
+        self._normalize = lru_cache(maxsize=maxsize)(normalize)
+
+    def encode(self, raw):
+        value = self._normalize(raw or "")
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
+    def decode(self, code):
+        return self.values[code]
+
+
+def new_dictionaries(normalizers=None, fields=CATEGORICAL_FIELDS):
+    normalizers = normalizers or {}
+    return {
+        field: CategoryDictionary(normalizers.get(field, str.strip))
+        for field in fields
+    }
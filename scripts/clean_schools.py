@@ -4,9 +4,24 @@ from collections import Counter
 from pathlib import Path
 
 try:
-    from scripts.geo_utils import coords_in_zimbabwe, open_csv, parse_float
+    from scripts.categories import new_dictionaries
 except ModuleNotFoundError:
-    from geo_utils import coords_in_zimbabwe, open_csv, parse_float
+    from categories import new_dictionaries
+
+try:
+    from scripts.geo_utils import (
+        coords_in_zimbabwe,
+        decimals_for_max_error,
+        open_csv,
+        parse_float,
+    )
+except ModuleNotFoundError:
+    from geo_utils import (
+        coords_in_zimbabwe,
+        decimals_for_max_error,
+        open_csv,
+        parse_float,
+    )
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
@@ -34,6 +49,27 @@ def normalize_title(value: str) -> str:
     return " ".join(words)
 
 
+def normalize_grant_class(value: str) -> str:
+    grant = normalize_spaces(value)
+    if grant == "(blank)":
+        grant = ""
+    return grant.upper()
+
+
+def new_category_dictionaries():
+    return new_dictionaries(
+        {
+            "Province": normalize_title,
+            "District": normalize_title,
+            "SchoolLevel": normalize_title,
+            "Grant_Class": normalize_grant_class,
+        }
+    )
+
+
+DEFAULT_CATEGORY_DICTIONARIES = new_category_dictionaries()
+
+
 def try_utm_to_latlon(x, y):
     try:
         from pyproj import Transformer
@@ -50,21 +86,15 @@ def try_utm_to_latlon(x, y):
     return None
 
 
-def clean_row(row):
+def clean_row(row, dictionaries=None):
+    if dictionaries is None:
+        dictionaries = DEFAULT_CATEGORY_DICTIONARIES
     cleaned = dict(row)
 
     cleaned["Schoolnumber"] = normalize_spaces(cleaned.get("Schoolnumber", ""))
     cleaned["Name"] = normalize_spaces(cleaned.get("Name", ""))
-    cleaned["Province"] = normalize_title(cleaned.get("Province", ""))
-    cleaned["District"] = normalize_title(cleaned.get("District", ""))
-
-    level = normalize_title(cleaned.get("SchoolLevel", ""))
-    cleaned["SchoolLevel"] = level
-
-    grant = normalize_spaces(cleaned.get("Grant_Class", ""))
-    if grant == "(blank)":
-        grant = ""
-    cleaned["Grant_Class"] = grant.upper()
+    for field, dictionary in dictionaries.items():
+        cleaned[field] = dictionary.decode(dictionary.encode(cleaned.get(field)))
 
     cleaned["Name_Normalized"] = cleaned["Name"].lower()
 
@@ -76,7 +106,18 @@ def main():
     parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
     parser.add_argument("--report", type=Path, default=REPORT_PATH)
+    parser.add_argument(
+        "--max-error-m",
+        type=float,
+        help="Round UTM-derived coordinates to the coarsest precision within this "
+        "many metres (default: 6 decimals).",
+    )
     args = parser.parse_args()
+    if args.max_error_m is not None and args.max_error_m <= 0:
+        parser.error("--max-error-m must be positive")
+    coord_decimals = 6
+    if args.max_error_m is not None:
+        coord_decimals = decimals_for_max_error(args.max_error_m)
 
     if not args.input.exists():
         raise SystemExit(f"Input CSV not found: {args.input}")
@@ -87,6 +128,7 @@ def main():
     missing_fields = Counter()
     level_counts = Counter()
     grant_counts = Counter()
+    dictionaries = new_category_dictionaries()
 
     with open_csv(args.input) as handle:
         reader = csv.DictReader(handle)
@@ -119,7 +161,7 @@ def main():
                     if value is None or str(value).strip() == "":
                         missing_fields[key] += 1
 
-                cleaned = clean_row(row)
+                cleaned = clean_row(row, dictionaries)
 
                 level = cleaned.get("SchoolLevel", "")
                 if level and level not in ALLOWED_LEVELS:
@@ -147,8 +189,8 @@ def main():
                         converted = try_utm_to_latlon(x, y)
                         if converted:
                             lat, lon = converted
-                            cleaned["latitude"] = f"{lat:.6f}"
-                            cleaned["longitude"] = f"{lon:.6f}"
+                            cleaned["latitude"] = f"{lat:.{coord_decimals}f}"
+                            cleaned["longitude"] = f"{lon:.{coord_decimals}f}"
                             stats["filled_from_xy"] += 1
                 if lat is not None and lon is not None:
                     if lat == 0.0 or lon == 0.0:
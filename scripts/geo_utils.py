@@ -1,3 +1,7 @@
+import json
+import math
+import re
+from contextlib import ExitStack
 from pathlib import Path
 
 try:
@@ -20,6 +24,83 @@ def coords_in_zimbabwe(lat, lon):
     )
 
 
+EARTH_RADIUS_M = 6_371_008.8
+METRES_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+QUANTIZE_MODES = ("fixed", "integer")
+
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def quantization_step(max_error_m):
+    """Largest grid step (degrees) whose snapping error stays within max_error_m.
+
+    Snapping moves each axis by at most half a step, and a degree of
+    longitude is never longer than a degree of latitude, so half a step on
+    both axes must fit inside max_error_m along the diagonal.
+    """
+    if max_error_m <= 0:
+        raise ValueError("max_error_m must be positive")
+    return math.sqrt(2) * max_error_m / METRES_PER_DEGREE
+
+
+def decimals_for_max_error(max_error_m):
+    return max(0, math.ceil(-math.log10(quantization_step(max_error_m))))
+
+
+def make_quantizer(max_error_m, mode="fixed", bounds=ZIM_BOUNDS):
+    """Return (quantize, transform) for snapping points to a grid over bounds.
+
+    quantize(lon, lat) returns the output coordinates and raises ValueError
+    if the snapped point lands more than max_error_m from the original.
+    "fixed" writes decimal degrees rounded to the coarsest precision that
+    meets the bound; "integer" writes grid indices, and transform holds the
+    TopoJSON-style scale/translate needed to decode them (None otherwise).
+    """
+    if mode not in QUANTIZE_MODES:
+        raise ValueError(f"Unknown quantize mode: {mode}")
+    lon_min = bounds["lon_min"]
+    lat_min = bounds["lat_min"]
+
+    if mode == "fixed":
+        decimals = decimals_for_max_error(max_error_m)
+        transform = None
+
+        def snap(lon, lat):
+            coords = [round(lon, decimals), round(lat, decimals)]
+            return coords, coords
+
+    else:
+        step = quantization_step(max_error_m)
+        transform = {"scale": [step, step], "translate": [lon_min, lat_min]}
+
+        def snap(lon, lat):
+            i = round((lon - lon_min) / step)
+            j = round((lat - lat_min) / step)
+            return [i, j], [lon_min + i * step, lat_min + j * step]
+
+    def quantize(lon, lat):
+        coords, (qlon, qlat) = snap(lon, lat)
+        error = haversine_m(lat, lon, qlat, qlon)
+        if error > max_error_m:
+            raise ValueError(
+                f"Quantized point ({lon}, {lat}) moved {error:.3f} m "
+                f"(limit {max_error_m} m)"
+            )
+        return coords
+
+    return quantize, transform
+
+
 def open_csv(path: Path):
     with path.open("rb") as handle:
         start = handle.read(4)
@@ -28,3 +109,177 @@ def open_csv(path: Path):
     else:
         encoding = "utf-8-sig"
     return path.open(newline="", encoding=encoding)
+
+
+RECORD_SEPARATOR = "\x1e"
+
+_READ_CHUNK = 1 << 16
+
+# Only trusted when it matches at the very start of a record, where the
+# geometry member cannot be confused with anything nested in properties.
+_LEADING_POINT = re.compile(
+    r'\{\s*"type"\s*:\s*"Feature"\s*,\s*"geometry"\s*:\s*'
+    r'\{\s*"type"\s*:\s*"Point"\s*,\s*"coordinates"\s*:\s*'
+    r"\[\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)\s*\]"
+)
+
+
+def write_geojsonseq(features, path: Path, rs=True):
+    """Write features one per line (RFC 8142 GeoJSONSeq, or NDJSON if rs=False)."""
+    return write_geojsonseq_files(features, [(path, rs)])
+
+
+def write_geojsonseq_files(features, targets):
+    """Write features to several (path, rs) sequence files in a single pass."""
+    count = 0
+    with ExitStack() as stack:
+        outputs = [
+            (
+                stack.enter_context(path.open("w", encoding="utf-8", newline="\n")),
+                RECORD_SEPARATOR if rs else "",
+            )
+            for path, rs in targets
+        ]
+        for feature in features:
+            record = json.dumps(feature, ensure_ascii=True) + "\n"
+            for handle, prefix in outputs:
+                handle.write(prefix)
+                handle.write(record)
+            count += 1
+    return count
+
+
+def _point_in_bbox(lon, lat, bbox):
+    lon_min, lat_min, lon_max, lat_max = bbox
+    return lon_min <= lon <= lon_max and lat_min <= lat <= lat_max
+
+
+def _accepted_values(expected):
+    if isinstance(expected, (set, frozenset, list, tuple)):
+        return list(expected)
+    return [expected]
+
+
+def _iter_rs_texts(handle):
+    """Yield (text, complete) for each RFC 7464 record, split on RS.
+
+    Records may span lines; a record that does not end in LF was truncated.
+    """
+    buffer = ""
+    while True:
+        chunk = handle.read(_READ_CHUNK)
+        if not chunk:
+            break
+        buffer += chunk
+        *texts, buffer = buffer.split(RECORD_SEPARATOR)
+        for text in texts:
+            yield text, text.endswith("\n")
+    yield buffer, buffer.endswith("\n")
+
+
+def _iter_texts(handle):
+    """Yield (text, line_number) per record; line_number is None for RS records."""
+    first = handle.read(1)
+    # str.isspace() counts RS as whitespace, so test for it first.
+    while first != RECORD_SEPARATOR and first.isspace():
+        first = handle.read(1)
+    handle.seek(0)
+    if first == RECORD_SEPARATOR:
+        for text, complete in _iter_rs_texts(handle):
+            # RFC 8142: truncated texts are skipped.
+            if complete and text.strip():
+                yield text, None
+        return
+    for line_number, line in enumerate(handle, 1):
+        if line.strip():
+            yield line, line_number
+
+
+def _point_coordinates(geometry):
+    """Return (lon, lat) for a well-formed Point geometry, else None."""
+    if not isinstance(geometry, dict) or geometry.get("type") != "Point":
+        return None
+    coordinates = geometry.get("coordinates")
+    if not isinstance(coordinates, list) or len(coordinates) < 2:
+        return None
+    lon, lat = coordinates[:2]
+    for value in (lon, lat):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+    return lon, lat
+
+
+def _leading_point(text):
+    match = _LEADING_POINT.match(text.lstrip())
+    if not match:
+        return None
+    lon = parse_float(match.group(1))
+    lat = parse_float(match.group(2))
+    if lon is None or lat is None:
+        return None
+    return lon, lat
+
+
+def iter_geojsonseq(path: Path, bbox=None, where=None):
+    """Yield features from a GeoJSONSeq or NDJSON file one record at a time.
+
+    Files starting with RS are read as RFC 8142 sequences (records may span
+    lines, truncated records are skipped); anything else is read as NDJSON,
+    where a line that is not valid JSON raises ValueError. Decoded values
+    that are not Features are skipped.
+
+    bbox is (lon_min, lat_min, lon_max, lat_max). where is either a dict of
+    property -> expected value (or set of accepted values), or a callable
+    taking the properties dict. In GeoJSONSeq files, string predicates and
+    leading Point coordinates are checked against the raw text first so most
+    non-matching records are skipped without being decoded; NDJSON lines are
+    always decoded so malformed lines are reported whatever the filters.
+    """
+    accepted = {}
+    needles = []
+    if isinstance(where, dict):
+        for key, expected in where.items():
+            accepted[key] = _accepted_values(expected)
+            if all(isinstance(value, str) for value in accepted[key]):
+                needles.append(
+                    [json.dumps(value, ensure_ascii=False) for value in accepted[key]]
+                )
+
+    with path.open(encoding="utf-8") as handle:
+        for text, line_number in _iter_texts(handle):
+            if line_number is None:
+                # Escaped text can spell a value many ways; only unescaped
+                # records are safe to reject by substring.
+                if needles and "\\" not in text:
+                    if any(not any(n in text for n in opts) for opts in needles):
+                        continue
+                if bbox is not None:
+                    point = _leading_point(text)
+                    if point is not None and not _point_in_bbox(*point, bbox):
+                        continue
+            try:
+                feature = json.loads(text)
+            except json.JSONDecodeError as exc:
+                if line_number is None:
+                    continue
+                raise ValueError(
+                    f"{path}:{line_number}: invalid NDJSON record: {exc}"
+                ) from exc
+            if not isinstance(feature, dict) or feature.get("type") != "Feature":
+                continue
+            if bbox is not None:
+                geometry = feature.get("geometry")
+                point = _point_coordinates(geometry)
+                if point is None or not _point_in_bbox(*point, bbox):
+                    continue
+            props = feature.get("properties")
+            if not isinstance(props, dict):
+                props = {}
+            if isinstance(where, dict):
+                if not all(
+                    props.get(key) in values for key, values in accepted.items()
+                ):
+                    continue
+            elif where is not None and not where(props):
+                continue
+            yield feature
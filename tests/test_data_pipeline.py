@@ -336,3 +336,485 @@ def test_build_geojson_requires_schema():
             input_csv.unlink()
         except FileNotFoundError:
             pass
+
+
+def test_geojsonseq_round_trip_with_filters():
+    from scripts import build_school_geojson as geo
+    from scripts.geo_utils import iter_geojsonseq, write_geojsonseq
+
+    base_dir = _base_temp_dir()
+    token = uuid.uuid4().hex
+    input_csv = base_dir / f"schools-seq-{token}.csv"
+    seq_path = base_dir / f"schools-{token}.geojsons"
+    rows = [
+        {
+            "Schoolnumber": "301",
+            "Name": "Harare One",
+            "Province": "Harare",
+            "District": "Harare",
+            "SchoolLevel": "Primary",
+            "Grant_Class": "P1",
+            "latitude": "-17.8",
+            "longitude": "31.0",
+        },
+        {
+            "Schoolnumber": "302",
+            "Name": "Bulawayo One",
+            "Province": "Bulawayo",
+            "District": "Bulawayo",
+            "SchoolLevel": "Primary",
+            "Grant_Class": "P2",
+            "latitude": "-20.1",
+            "longitude": "28.6",
+        },
+    ]
+    fieldnames = list(rows[0].keys())
+    write_csv(input_csv, rows, fieldnames)
+
+    try:
+        count = write_geojsonseq(geo.iter_features("Primary", input_csv), seq_path)
+        assert count == 2
+        raw = seq_path.read_text(encoding="utf-8")
+        assert raw.startswith("\x1e{")
+        assert raw.count("\n") == 2
+
+        features = list(iter_geojsonseq(seq_path))
+        assert features == geo.build_geojson("Primary", input_csv)["features"]
+
+        in_harare = list(iter_geojsonseq(seq_path, bbox=(30.5, -18.5, 31.5, -17.5)))
+        assert [f["properties"]["Schoolnumber"] for f in in_harare] == ["301"]
+
+        by_province = list(iter_geojsonseq(seq_path, where={"Province": "Bulawayo"}))
+        assert [f["properties"]["Schoolnumber"] for f in by_province] == ["302"]
+
+        by_callable = list(
+            iter_geojsonseq(seq_path, where=lambda p: p["Grant_Class"] == "P1")
+        )
+        assert [f["properties"]["Schoolnumber"] for f in by_callable] == ["301"]
+    finally:
+        for path in (input_csv, seq_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _seq_feature(number, lon, lat, province="Harare", **extra_props):
+    props = {"Schoolnumber": number, "Province": province}
+    props.update(extra_props)
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": props,
+    }
+
+
+def test_write_outputs_writes_ndjson_and_geojsonseq(monkeypatch):
+    from scripts import build_school_geojson as geo
+    from scripts.geo_utils import iter_geojsonseq
+
+    base_dir = _base_temp_dir()
+    token = uuid.uuid4().hex
+    input_csv = base_dir / f"schools-outputs-{token}.csv"
+    config = {
+        "geojson": base_dir / f"out-{token}.geojson",
+        "geojsonseq": base_dir / f"out-{token}.geojsons",
+        "ndjson": base_dir / f"out-{token}.ndjson",
+    }
+    rows = [
+        {
+            "Schoolnumber": "351",
+            "Name": "Alpha",
+            "Province": "Harare",
+            "District": "Harare",
+            "SchoolLevel": "Primary",
+            "Grant_Class": "P1",
+            "latitude": "-17.8",
+            "longitude": "31.0",
+        }
+    ]
+    write_csv(input_csv, rows, list(rows[0].keys()))
+
+    passes = []
+    iter_features = geo.iter_features
+
+    def counting_iter_features(*args, **kwargs):
+        passes.append(args[0])
+        return iter_features(*args, **kwargs)
+
+    monkeypatch.setattr(geo, "iter_features", counting_iter_features)
+
+    try:
+        geo.write_outputs(
+            "Primary", config, input_csv, seq_formats=geo.SEQ_FORMATS
+        )
+        # One pass for the GeoJSON, one shared by both sequence files.
+        assert len(passes) == 2
+        monkeypatch.setattr(geo, "iter_features", iter_features)
+        expected = geo.build_geojson("Primary", input_csv)["features"]
+
+        ndjson_text = config["ndjson"].read_text(encoding="utf-8")
+        assert "\x1e" not in ndjson_text
+        assert list(iter_geojsonseq(config["ndjson"])) == expected
+
+        seq_text = config["geojsonseq"].read_text(encoding="utf-8")
+        assert seq_text.startswith("\x1e")
+        assert list(iter_geojsonseq(config["geojsonseq"])) == expected
+    finally:
+        for path in (input_csv, *config.values()):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def test_iter_geojsonseq_reads_other_writers():
+    import json
+
+    from scripts.geo_utils import iter_geojsonseq
+
+    base_dir = _base_temp_dir()
+    token = uuid.uuid4().hex
+    compact_path = base_dir / f"compact-{token}.ndjson"
+    unicode_path = base_dir / f"unicode-{token}.ndjson"
+    escaped_path = base_dir / f"escaped-{token}.ndjson"
+    pretty_path = base_dir / f"pretty-{token}.geojsons"
+
+    harare = _seq_feature("1", 31.0, -17.8)
+    accented = _seq_feature("2", 31.0, -17.8, province="Hàrare")
+    decoy = _seq_feature("3", 31.0, -17.8, note={"coordinates": [0, 0]})
+    bulawayo = _seq_feature("4", 28.6, -20.1, province="Bulawayo")
+
+    compact_path.write_text(
+        "\n".join(
+            json.dumps(f, separators=(",", ":")) for f in (harare, decoy, bulawayo)
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    unicode_path.write_text(
+        json.dumps(accented, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    escaped_path.write_text(json.dumps(accented) + "\n", encoding="utf-8")
+    pretty_path.write_text(
+        "".join(
+            "\x1e" + json.dumps(f, indent=2) + "\n" for f in (harare, bulawayo)
+        ),
+        encoding="utf-8",
+    )
+
+    try:
+        by_province = list(iter_geojsonseq(compact_path, where={"Province": "Harare"}))
+        assert [f["properties"]["Schoolnumber"] for f in by_province] == ["1", "3"]
+
+        in_harare = list(iter_geojsonseq(compact_path, bbox=(30, -18, 32, -17)))
+        assert [f["properties"]["Schoolnumber"] for f in in_harare] == ["1", "3"]
+
+        for path in (unicode_path, escaped_path):
+            matched = list(iter_geojsonseq(path, where={"Province": "Hàrare"}))
+            assert matched == [accented]
+
+        assert list(iter_geojsonseq(pretty_path)) == [harare, bulawayo]
+        in_bulawayo = list(iter_geojsonseq(pretty_path, bbox=(28, -21, 29, -20)))
+        assert in_bulawayo == [bulawayo]
+    finally:
+        for path in (compact_path, unicode_path, escaped_path, pretty_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def test_iter_geojsonseq_handles_bad_records():
+    import json
+
+    from scripts.geo_utils import iter_geojsonseq
+
+    base_dir = _base_temp_dir()
+    token = uuid.uuid4().hex
+    seq_path = base_dir / f"bad-{token}.geojsons"
+    ndjson_path = base_dir / f"bad-{token}.ndjson"
+    feature = _seq_feature("1", 31.0, -17.8)
+    bad_geometries = [
+        {"type": "Point"},
+        {"type": "Point", "coordinates": [31.0]},
+        {"type": "Point", "coordinates": ["31.0", "-17.8"]},
+        {"type": "Point", "coordinates": None},
+    ]
+    bad_points = "".join(
+        "\x1e" + json.dumps({**feature, "geometry": geometry}) + "\n"
+        for geometry in bad_geometries
+    )
+
+    seq_path.write_text(
+        "\x1e2\n"
+        "\x1e[1, 2]\n"
+        + bad_points
+        + "\x1e" + json.dumps(feature) + "\n"
+        "\x1e{\"type\": \"Feat",
+        encoding="utf-8",
+    )
+    ndjson_path.write_text(
+        "2\n[1, 2]\n" + json.dumps(feature) + "\n{\"type\": \"Feat\n",
+        encoding="utf-8",
+    )
+
+    try:
+        assert len(list(iter_geojsonseq(seq_path))) == 1 + len(bad_geometries)
+        in_harare = list(iter_geojsonseq(seq_path, bbox=(30, -18, 32, -17)))
+        assert in_harare == [feature]
+
+        for kwargs in ({"where": {"Province": "Harare"}}, {"bbox": (30, -18, 32, -17)}):
+            records = iter_geojsonseq(ndjson_path, **kwargs)
+            assert next(records) == feature
+            try:
+                next(records)
+                assert False, f"Expected ValueError with {kwargs}"
+            except ValueError as exc:
+                assert ":4:" in str(exc)
+
+        records = iter_geojsonseq(ndjson_path)
+        assert next(records) == feature
+        try:
+            next(records)
+            assert False, "Expected ValueError for malformed NDJSON line"
+        except ValueError as exc:
+            assert ":4:" in str(exc)
+    finally:
+        for path in (seq_path, ndjson_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def test_build_geojson_dictionary_encodes_categories():
+    from scripts import build_school_geojson as geo
+
+    base_dir = _base_temp_dir()
+    token = uuid.uuid4().hex
+    input_csv = base_dir / f"schools-dict-{token}.csv"
+    rows = [
+        {
+            "Schoolnumber": str(400 + index),
+            "Name": f"School {index}",
+            "Province": " Harare " if index % 2 else "Harare",
+            "District": "Harare",
+            "SchoolLevel": "Primary",
+            "Grant_Class": "P1" if index < 2 else "P2",
+            "latitude": "-17.8",
+            "longitude": "31.0",
+        }
+        for index in range(4)
+    ]
+    fieldnames = list(rows[0].keys())
+    write_csv(input_csv, rows, fieldnames)
+
+    try:
+        plain = geo.build_geojson("Primary", input_csv)
+        assert "dictionaries" not in plain
+        provinces = [f["properties"]["Province"] for f in plain["features"]]
+        assert provinces == ["Harare"] * 4
+        assert all(value is provinces[0] for value in provinces)
+
+        encoded = geo.build_geojson("Primary", input_csv, encode_categories=True)
+        dictionaries = encoded["dictionaries"]
+        assert dictionaries["Province"] == ["Harare"]
+        assert dictionaries["Grant_Class"] == ["P1", "P2"]
+        codes = [f["properties"]["Grant_Class"] for f in encoded["features"]]
+        assert codes == [0, 0, 1, 1]
+        for enc, dec in zip(encoded["features"], plain["features"]):
+            decoded = {
+                key: dictionaries[key][value] if key in dictionaries else value
+                for key, value in enc["properties"].items()
+            }
+            assert decoded == dec["properties"]
+    finally:
+        try:
+            input_csv.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def test_clean_row_shares_normalized_categories():
+    from scripts import clean_schools as clean
+
+    dictionaries = clean.new_category_dictionaries()
+    row = {
+        "Schoolnumber": "1",
+        "Name": "Alpha",
+        "Province": "mashonaland  east",
+        "District": "HARARE",
+        "SchoolLevel": "primary",
+        "Grant_Class": " p1 ",
+    }
+    first = clean.clean_row(row, dictionaries)
+    second = clean.clean_row({**row, "Grant_Class": "(blank)"}, dictionaries)
+
+    assert first["Province"] == "Mashonaland East"
+    assert first["District"] == "HARARE"
+    assert first["SchoolLevel"] == "Primary"
+    assert first["Grant_Class"] == "P1"
+    assert second["Grant_Class"] == ""
+    for field in ("Province", "District", "SchoolLevel"):
+        assert first[field] is second[field]
+    assert dictionaries["Province"].values == ["Mashonaland East"]
+    assert dictionaries["Grant_Class"].values == ["P1", ""]
+
+    default_first = clean.clean_row(row)
+    default_second = clean.clean_row(dict(row))
+    assert default_first["Province"] is default_second["Province"]
+
+
+def test_build_geojson_quantizes_within_error_bound():
+    from scripts import build_school_geojson as geo
+    from scripts.geo_utils import haversine_m
+
+    base_dir = _base_temp_dir()
+    token = uuid.uuid4().hex
+    input_csv = base_dir / f"schools-quantize-{token}.csv"
+    rows = [
+        {
+            "Schoolnumber": "501",
+            "Name": "Precise",
+            "Province": "Harare",
+            "District": "Harare",
+            "SchoolLevel": "Primary",
+            "Grant_Class": "P1",
+            "latitude": "-17.829212345678",
+            "longitude": "31.052298765432",
+        },
+        {
+            "Schoolnumber": "502",
+            "Name": "Edge",
+            "Province": "Matabeleland South",
+            "District": "Beitbridge",
+            "SchoolLevel": "Primary",
+            "Grant_Class": "P3",
+            "latitude": "-22.2172839",
+            "longitude": "29.9876543",
+        },
+    ]
+    fieldnames = list(rows[0].keys())
+    write_csv(input_csv, rows, fieldnames)
+
+    try:
+        fixed = geo.build_geojson("Primary", input_csv, max_error_m=1.0)
+        assert "transform" not in fixed
+        assert fixed["features"][0]["geometry"]["coordinates"] == [31.0523, -17.82921]
+
+        coarse = geo.build_geojson("Primary", input_csv, max_error_m=100.0)
+        assert coarse["features"][0]["geometry"]["coordinates"] == [31.052, -17.829]
+
+        integer = geo.build_geojson(
+            "Primary", input_csv, max_error_m=1.0, quantize_mode="integer"
+        )
+        scale = integer["transform"]["scale"]
+        translate = integer["transform"]["translate"]
+        assert translate == [geo.ZIM_BOUNDS["lon_min"], geo.ZIM_BOUNDS["lat_min"]]
+        for feature, row in zip(integer["features"], rows):
+            i, j = feature["geometry"]["coordinates"]
+            assert isinstance(i, int) and isinstance(j, int)
+            lon = translate[0] + i * scale[0]
+            lat = translate[1] + j * scale[1]
+            error = haversine_m(float(row["latitude"]), float(row["longitude"]), lat, lon)
+            assert error <= 1.0
+    finally:
+        try:
+            input_csv.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def test_make_quantizer_rejects_bad_settings(monkeypatch):
+    from scripts import geo_utils
+
+    for kwargs in ({"max_error_m": 0}, {"max_error_m": 1.0, "mode": "polar"}):
+        try:
+            geo_utils.make_quantizer(**kwargs)
+            assert False, f"Expected ValueError for {kwargs}"
+        except ValueError:
+            pass
+
+    monkeypatch.setattr(geo_utils, "decimals_for_max_error", lambda _m: 0)
+    quantize, _ = geo_utils.make_quantizer(1.0)
+    try:
+        quantize(31.4, -17.8)
+        assert False, "Expected ValueError for a point moved past the bound"
+    except ValueError as exc:
+        assert "limit 1.0 m" in str(exc)
+
+
+def test_build_geojson_quantize_mode_requires_max_error():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "scripts/build_school_geojson.py",
+            "--quantize-mode",
+            "integer",
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "--quantize-mode requires --max-error-m" in result.stderr
+
+
+def test_clean_schools_max_error_sets_utm_decimals(monkeypatch):
+    from scripts import clean_schools as clean
+
+    base_dir = _base_temp_dir()
+    token = uuid.uuid4().hex
+    input_csv = base_dir / f"utm-{token}.csv"
+    output_csv = base_dir / f"utm-clean-{token}.csv"
+    report_md = base_dir / f"utm-report-{token}.md"
+
+    rows = [
+        {
+            "Schoolnumber": "601",
+            "Name": "From UTM",
+            "Province": "Bulawayo",
+            "District": "Bulawayo",
+            "SchoolLevel": "Primary",
+            "Grant_Class": "P1",
+            "latitude": "",
+            "longitude": "",
+            "X": "650000",
+            "Y": "7775000",
+        }
+    ]
+    write_csv(input_csv, rows, list(rows[0].keys()))
+
+    monkeypatch.setattr(
+        clean, "try_utm_to_latlon", lambda _x, _y: (-20.123456789, 28.987654321)
+    )
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "clean_schools.py",
+            "--input",
+            str(input_csv),
+            "--output",
+            str(output_csv),
+            "--report",
+            str(report_md),
+            "--max-error-m",
+            "100",
+        ],
+    )
+
+    try:
+        clean.main()
+        with output_csv.open(newline="", encoding="utf-8") as handle:
+            cleaned = list(csv.DictReader(handle))
+        assert cleaned[0]["latitude"] == "-20.123"
+        assert cleaned[0]["longitude"] == "28.988"
+    finally:
+        for path in (input_csv, output_csv, report_md):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass